@@ -12,6 +12,7 @@ Two profiles are provided:
 Select the active profile by setting ACTIVE_PROFILE below.
 """
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
@@ -43,7 +44,7 @@ class OperatingState(Enum):
 # ──────────────────────────────────────────────
 # pH-Stat Configuration
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PHConfig:
     """pH-stat CO₂ dosing controller parameters."""
     setpoint: float              # Target pH
@@ -90,7 +91,7 @@ INDUSTRIAL_PH = PHConfig(
 # ──────────────────────────────────────────────
 # Vision Sensor Configuration
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisionConfig:
     """Computer vision soft sensor parameters."""
     camera_index: int            # OpenCV camera device index
@@ -146,7 +147,7 @@ INDUSTRIAL_VISION = VisionConfig(
 # ──────────────────────────────────────────────
 # LED / PWM Configuration
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LEDConfig:
     """LED PWM and Flashing Light Effect parameters."""
     pwm_pin: int                 # GPIO pin for PWM output (BCM numbering)
@@ -182,7 +183,7 @@ INDUSTRIAL_LED = LEDConfig(
 # ──────────────────────────────────────────────
 # Pump / VFD Configuration
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PumpConfig:
     """Pump and Variable Frequency Drive parameters."""
     # Relay pin (garage) or Modbus address (industrial)
@@ -221,7 +222,7 @@ INDUSTRIAL_PUMP = PumpConfig(
 # ──────────────────────────────────────────────
 # CO₂ Solenoid Valve
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CO2ValveConfig:
     """CO₂ solenoid valve control."""
     relay_pin: int                     # GPIO pin controlling the solenoid relay
@@ -234,7 +235,7 @@ INDUSTRIAL_CO2 = CO2ValveConfig(relay_pin=27)
 # ──────────────────────────────────────────────
 # Harvest Configuration (Industrial only)
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HarvestConfig:
     """Turbidostat harvest trigger parameters."""
     density_trigger_g_l: float         # Biomass density threshold for harvest
@@ -252,7 +253,7 @@ INDUSTRIAL_HARVEST = HarvestConfig(
 # ──────────────────────────────────────────────
 # Webhook / Alerts
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertConfig:
     """Webhook and notification settings."""
     enabled: bool
@@ -274,7 +275,7 @@ ALERTS = AlertConfig(
 # ──────────────────────────────────────────────
 # Logging
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Logging and data recording settings."""
     log_dir: str
@@ -298,7 +299,13 @@ LOG = LogConfig(
 # ──────────────────────────────────────────────
 def get_config():
     """Return the full configuration dict for the active profile."""
-    if ACTIVE_PROFILE == Profile.GARAGE:
+    return _build_config(ACTIVE_PROFILE)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_config(profile: Profile) -> dict:
+    """Assemble the config dict for a profile (memoized per profile)."""
+    if profile == Profile.GARAGE:
         return {
             "profile": Profile.GARAGE,
             "ph": GARAGE_PH,
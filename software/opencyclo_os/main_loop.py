@@ -28,6 +28,7 @@ Garage reference: OPENCYCLO V0.1-ALPHA §3
 
 import argparse
 import asyncio
+import concurrent.futures
 import logging
 import signal
 import sys
@@ -44,7 +45,7 @@ from ph_stat_co2 import PHStatController
 from vision_density import VisionDensitySensor
 from led_pwm_sync import LEDController
 from utils.logger import setup_logger, log_sensor_data
-from utils.webhook import send_webhook
+from utils.webhook import send_webhook, close_webhook
 
 logger: Optional[logging.Logger] = None
 
@@ -61,9 +62,18 @@ class PumpController:
     INDUSTRIAL:  VFD controlled via RS-485 Modbus (continuous speed control)
     """
 
+    __slots__ = (
+        "_pump_cfg", "_control_pin", "_modbus_addr",
+        "_gpio", "_modbus_client",
+        "_current_speed_pct", "_actual_frequency_hz",
+    )
+
     def __init__(self):
         cfg = get_config()
         self._pump_cfg = cfg["pump"]
+        # Cached for the set_speed hot path
+        self._control_pin = self._pump_cfg.control_pin
+        self._modbus_addr = self._pump_cfg.modbus_address
         self._gpio = None
         self._modbus_client = None
         self._current_speed_pct: float = 0.0
@@ -83,11 +93,15 @@ class PumpController:
             return
         try:
             import RPi.GPIO as GPIO
+        except ImportError:
+            logger.info("RPi.GPIO unavailable, simulating pump relay")
+            return
+        try:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
             self._gpio = GPIO
             logger.info(f"Pump relay initialized on GPIO {pin}")
-        except (ImportError, Exception) as exc:
+        except (RuntimeError, OSError) as exc:
             logger.warning(f"Pump GPIO init failed ({exc}), using simulation")
 
     def _init_modbus(self):
@@ -98,13 +112,19 @@ class PumpController:
             return
         try:
             from pymodbus.client import ModbusSerialClient
+            from pymodbus.exceptions import ConnectionException, ModbusIOException
+        except ImportError:
+            logger.info("pymodbus unavailable, simulating pump VFD")
+            return
+        try:
             self._modbus_client = ModbusSerialClient(
                 port=port, baudrate=9600, parity="N", stopbits=1, timeout=1,
             )
             self._modbus_client.connect()
             logger.info(f"Pump VFD Modbus connected on {port} (addr={addr})")
-        except (ImportError, Exception) as exc:
+        except (ConnectionException, ModbusIOException, OSError) as exc:
             logger.warning(f"Modbus init failed ({exc}), using simulation")
+            self._modbus_client = None
 
     def set_speed(self, percent: float):
         """Set pump speed as a percentage of maximum (0-100)."""
@@ -113,11 +133,11 @@ class PumpController:
 
         if ACTIVE_PROFILE == Profile.GARAGE:
             # Garage: relay ON/OFF (no speed control on DC pump without PWM)
-            if self._gpio and self._pump_cfg.control_pin:
+            if self._gpio and self._control_pin:
                 if percent > 0:
-                    self._gpio.output(self._pump_cfg.control_pin, self._gpio.HIGH)
+                    self._gpio.output(self._control_pin, self._gpio.HIGH)
                 else:
-                    self._gpio.output(self._pump_cfg.control_pin, self._gpio.LOW)
+                    self._gpio.output(self._control_pin, self._gpio.LOW)
             # Simulate a base frequency for LED sync
             self._actual_frequency_hz = 50.0 * (percent / 100.0) if percent > 0 else 0.0
         else:
@@ -128,11 +148,11 @@ class PumpController:
                     freq_value = int(percent * 100)  # 0-10000
                     self._modbus_client.write_register(
                         0x2000, freq_value,
-                        slave=self._pump_cfg.modbus_address,
+                        slave=self._modbus_addr,
                     )
                     # Read actual frequency back
                     result = self._modbus_client.read_holding_registers(
-                        0x2001, 1, slave=self._pump_cfg.modbus_address,
+                        0x2001, 1, slave=self._modbus_addr,
                     )
                     if not result.isError():
                         self._actual_frequency_hz = result.registers[0] / 100.0
@@ -159,8 +179,8 @@ class PumpController:
 
     def cleanup(self):
         self.stop()
-        if self._gpio and self._pump_cfg.control_pin:
-            self._gpio.cleanup(self._pump_cfg.control_pin)
+        if self._gpio and self._control_pin:
+            self._gpio.cleanup(self._control_pin)
         if self._modbus_client:
             self._modbus_client.close()
 
@@ -175,6 +195,19 @@ class OpenCycloOrchestrator:
     and coordinating all subsystem controllers.
     """
 
+    # Fixed attribute layout: read on every state-machine tick, and any
+    # typo at an assignment site fails loudly instead of creating a new attr
+    __slots__ = (
+        "_cfg", "_state", "_prev_state",
+        "_ph_stat", "_vision", "_led", "_pump",
+        "_tasks", "_webhook_q",
+        "_nursery_start",
+        "_harvest_cfg", "_is_harvesting", "_harvest_task",
+        "_pump_nursery_pct", "_pump_growth_pct", "_pump_steady_pct",
+        "_max_flow_lph", "_nursery_duration_h",
+        "_density_trigger", "_harvest_volume_l", "_alerts",
+    )
+
     def __init__(self):
         cfg = get_config()
         self._cfg = cfg
@@ -190,12 +223,34 @@ class OpenCycloOrchestrator:
         # Task handles
         self._tasks: list[asyncio.Task] = []
 
+        # Webhook notifications are enqueued here and drained by a worker
+        # task so state transitions never block on HTTP round-trips
+        self._webhook_q: asyncio.Queue = asyncio.Queue(maxsize=64)
+
         # Nursery timer
         self._nursery_start: Optional[float] = None
 
         # Harvest config (industrial only)
         self._harvest_cfg = cfg.get("harvest")
         self._is_harvesting = False
+        self._harvest_task: Optional[asyncio.Task] = None
+
+        # Flat config caches — avoids dict + dataclass lookups on every
+        # state-machine tick (the config is immutable after startup)
+        self._pump_nursery_pct = cfg["pump"].nursery_speed_percent
+        self._pump_growth_pct = cfg["pump"].growth_speed_percent
+        self._pump_steady_pct = cfg["pump"].steady_state_speed_percent
+        self._max_flow_lph = cfg["pump"].max_flow_rate_lph
+        self._nursery_duration_h = cfg["led"].nursery_duration_hours
+        self._density_trigger = (
+            self._harvest_cfg.density_trigger_g_l
+            if self._harvest_cfg else float("inf")
+        )
+        self._harvest_volume_l = (
+            1000.0 * self._harvest_cfg.harvest_volume_fraction
+            if self._harvest_cfg else 0.0
+        )
+        self._alerts = cfg["alerts"]
 
     async def initialize(self):
         """Initialize all subsystem hardware."""
@@ -223,15 +278,25 @@ class OpenCycloOrchestrator:
             asyncio.create_task(self._ph_stat.run(), name="ph_stat"),
             asyncio.create_task(self._vision.run(), name="vision"),
             asyncio.create_task(self._led.run(), name="led"),
+            asyncio.create_task(self._webhook_worker(), name="webhook"),
         ]
 
         # Transition to NURSERY mode on startup
         await self._transition_to(OperatingState.NURSERY)
 
+        # Bind loop-invariant lookups once — the tick loop then runs on
+        # LOAD_FAST locals instead of repeated attribute/descriptor walks
+        tick = self._state_machine_tick
+        led_update = self._led.update_pump_frequency
+        pump = self._pump
+        sleep = asyncio.sleep
+
         try:
             while self._state != OperatingState.SHUTDOWN:
-                await self._state_machine_tick()
-                await asyncio.sleep(2.0)  # State machine poll interval
+                await tick()
+                # Sync LED PWM with pump frequency (all states)
+                led_update(pump.actual_frequency_hz)
+                await sleep(2.0)  # State machine poll interval
         except asyncio.CancelledError:
             logger.info("Orchestrator cancelled")
         finally:
@@ -240,42 +305,50 @@ class OpenCycloOrchestrator:
     async def _state_machine_tick(self):
         """Evaluate state transition conditions on each tick."""
 
-        if self._state == OperatingState.NURSERY:
-            # Check if nursery period is complete
-            if self._nursery_start is not None:
-                elapsed_h = (time.monotonic() - self._nursery_start) / 3600.0
-                nursery_duration = self._cfg["led"].nursery_duration_hours
-
-                if elapsed_h >= nursery_duration:
+        # match on the enum lowers to a single compare chain that CPython
+        # specializes, rather than repeated LOAD_ATTR + == per branch
+        match self._state:
+            case OperatingState.NURSERY:
+                # Check if nursery period is complete
+                if self._nursery_start is not None:
+                    elapsed_h = (time.monotonic() - self._nursery_start) / 3600.0
+                    nursery_duration = self._nursery_duration_h
+
+                    if elapsed_h >= nursery_duration:
+                        logger.info(
+                            "Nursery period complete (%sh elapsed). "
+                            "Transitioning to LOGARITHMIC_GROWTH.",
+                            nursery_duration,
+                        )
+                        await self._transition_to(OperatingState.LOGARITHMIC_GROWTH)
+
+            case OperatingState.LOGARITHMIC_GROWTH:
+                # Check if biomass density has reached the turbidostat trigger
+                density = self._vision.latest_density
+                if density >= self._density_trigger:
                     logger.info(
-                        f"Nursery period complete ({nursery_duration}h elapsed). "
-                        "Transitioning to LOGARITHMIC_GROWTH."
+                        "Biomass density %.2f g/L ≥ trigger %s g/L. "
+                        "Transitioning to STEADY_STATE_TURBIDOSTAT.",
+                        density, self._density_trigger,
                     )
-                    await self._transition_to(OperatingState.LOGARITHMIC_GROWTH)
-
-        elif self._state == OperatingState.LOGARITHMIC_GROWTH:
-            # Check if biomass density has reached the turbidostat trigger
-            density = self._vision.latest_density
-            if self._harvest_cfg and density >= self._harvest_cfg.density_trigger_g_l:
-                logger.info(
-                    f"Biomass density {density:.2f} g/L ≥ trigger "
-                    f"{self._harvest_cfg.density_trigger_g_l} g/L. "
-                    "Transitioning to STEADY_STATE_TURBIDOSTAT."
-                )
-                await self._transition_to(OperatingState.STEADY_STATE_TURBIDOSTAT)
-
-        elif self._state == OperatingState.STEADY_STATE_TURBIDOSTAT:
-            # Monitor density and trigger harvests
-            density = self._vision.latest_density
-            if self._harvest_cfg and density >= self._harvest_cfg.density_trigger_g_l and not self._is_harvesting:
-                asyncio.create_task(self._trigger_harvest())
-
-            # In garage mode, just log (no automated harvest)
-            if ACTIVE_PROFILE == Profile.GARAGE:
-                pass  # Operator manually harvests via siphon
+                    await self._transition_to(OperatingState.STEADY_STATE_TURBIDOSTAT)
+
+            case OperatingState.STEADY_STATE_TURBIDOSTAT:
+                # Monitor density and trigger harvests
+                density = self._vision.latest_density
+                if density >= self._density_trigger and not self._is_harvesting:
+                    # Claim the flag before the task first awaits, so two
+                    # consecutive ticks cannot spawn concurrent harvests
+                    self._is_harvesting = True
+                    self._harvest_task = asyncio.create_task(
+                        self._trigger_harvest(), name="harvest",
+                    )
+                    self._harvest_task.add_done_callback(self._on_harvest_done)
+                # In garage mode the operator manually harvests via siphon
+                # (density trigger is +inf, so the branch above never fires)
 
-        # Sync LED PWM with pump frequency (all states)
-        self._led.update_pump_frequency(self._pump.actual_frequency_hz)
+            case _:
+                pass
 
     async def _transition_to(self, new_state: OperatingState):
         """Execute a state transition with all side effects."""
@@ -283,41 +356,56 @@ class OpenCycloOrchestrator:
         self._state = new_state
         self._prev_state = old
 
-        logger.info(f"STATE TRANSITION: {old.name} → {new_state.name}")
+        logger.info("STATE TRANSITION: %s → %s", old.name, new_state.name)
 
         # Apply state-specific settings
-        if new_state == OperatingState.NURSERY:
-            self._nursery_start = time.monotonic()
-            self._pump.set_speed(self._cfg["pump"].nursery_speed_percent)
-            self._led.set_state(OperatingState.NURSERY)
-
-        elif new_state == OperatingState.LOGARITHMIC_GROWTH:
-            self._pump.set_speed(self._cfg["pump"].growth_speed_percent)
-            self._led.set_state(OperatingState.LOGARITHMIC_GROWTH)
-
-        elif new_state == OperatingState.STEADY_STATE_TURBIDOSTAT:
-            self._pump.set_speed(self._cfg["pump"].steady_state_speed_percent)
-            self._led.set_state(OperatingState.STEADY_STATE_TURBIDOSTAT)
-
-        elif new_state == OperatingState.PH_SHOCK:
-            # Keep pump running to maintain vortex mixing
-            self._led.set_state(OperatingState.PH_SHOCK)
-            # pH shock is driven by ph_stat_co2.override_ph_shock()
-
-        elif new_state == OperatingState.SHUTDOWN:
-            self._pump.stop()
-            self._led.set_state(OperatingState.SHUTDOWN)
-
-        # Fire webhook
-        alerts = self._cfg["alerts"]
+        match new_state:
+            case OperatingState.NURSERY:
+                self._nursery_start = time.monotonic()
+                self._pump.set_speed(self._pump_nursery_pct)
+                self._led.set_state(OperatingState.NURSERY)
+
+            case OperatingState.LOGARITHMIC_GROWTH:
+                self._pump.set_speed(self._pump_growth_pct)
+                self._led.set_state(OperatingState.LOGARITHMIC_GROWTH)
+
+            case OperatingState.STEADY_STATE_TURBIDOSTAT:
+                self._pump.set_speed(self._pump_steady_pct)
+                self._led.set_state(OperatingState.STEADY_STATE_TURBIDOSTAT)
+
+            case OperatingState.PH_SHOCK:
+                # Keep pump running to maintain vortex mixing
+                self._led.set_state(OperatingState.PH_SHOCK)
+                # pH shock is driven by ph_stat_co2.override_ph_shock()
+
+            case OperatingState.SHUTDOWN:
+                self._pump.stop()
+                self._led.set_state(OperatingState.SHUTDOWN)
+
+        # Fire webhook (fire-and-forget — the worker task delivers it)
+        alerts = self._alerts
         if alerts.enabled and alerts.alert_on_state_change:
-            await send_webhook(
-                url=alerts.webhook_url,
-                event="state_change",
-                message=f"Bioreactor state: {old.name} → {new_state.name}",
-                severity="info",
-                data={"old_state": old.name, "new_state": new_state.name},
-            )
+            try:
+                self._webhook_q.put_nowait({
+                    "url": alerts.webhook_url,
+                    "event": "state_change",
+                    "message": f"Bioreactor state: {old.name} → {new_state.name}",
+                    "severity": "info",
+                    "data": {"old_state": old.name, "new_state": new_state.name},
+                })
+            except asyncio.QueueFull:
+                logger.warning("Webhook queue full, dropping state_change notification")
+
+    async def _webhook_worker(self):
+        """Drain queued webhook notifications off the control-loop path."""
+        while True:
+            msg = await self._webhook_q.get()
+            try:
+                await send_webhook(**msg)
+            except Exception as exc:
+                logger.warning(f"Webhook delivery error: {exc}")
+            finally:
+                self._webhook_q.task_done()
 
     async def _trigger_harvest(self):
         """
@@ -328,19 +416,19 @@ class OpenCycloOrchestrator:
 
         GARAGE: Logs a notification for manual siphon harvest.
         """
-        if ACTIVE_PROFILE == Profile.GARAGE:
-            density = self._vision.latest_density
-            logger.info(
-                f"🌿 HARVEST READY: Biomass density = {density:.2f} g/L. "
-                "Turn off pump, let settle in neck for 12h, siphon the paste."
-            )
-            return
-
-        # Industrial: automated valve operation
-        logger.info("Triggering turbidostat harvest cycle...")
-        self._is_harvesting = True
         try:
-            harvest_cfg = self._cfg.get("harvest")
+            if ACTIVE_PROFILE == Profile.GARAGE:
+                density = self._vision.latest_density
+                logger.info(
+                    "🌿 HARVEST READY: Biomass density = %.2f g/L. "
+                    "Turn off pump, let settle in neck for 12h, siphon the paste.",
+                    density,
+                )
+                return
+
+            # Industrial: automated valve operation
+            logger.info("Triggering turbidostat harvest cycle...")
+            harvest_cfg = self._harvest_cfg
             if not harvest_cfg or not harvest_cfg.harvest_valve_pin:
                 logger.warning("Harvest valve not configured, skipping...")
                 return
@@ -348,6 +436,13 @@ class OpenCycloOrchestrator:
             pin = harvest_cfg.harvest_valve_pin
             try:
                 import RPi.GPIO as GPIO
+            except ImportError:
+                logger.warning("RPi.GPIO not found (simulation mode) — Harvest simulated.")
+                await asyncio.sleep(5.0)
+                logger.info("Simulated harvest complete.")
+                return
+
+            try:
                 GPIO.setmode(GPIO.BCM)
                 GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
                 
@@ -356,35 +451,60 @@ class OpenCycloOrchestrator:
                 GPIO.output(pin, GPIO.HIGH)
                 
                 # 2. Divert 15% volume through hydrocyclone at 3 Bar
-                volume_l = 1000.0 * harvest_cfg.harvest_volume_fraction
+                volume_l = self._harvest_volume_l
                 speed_pct = self._pump.speed_percent
                 if speed_pct <= 0:
                     logger.error("Pump is stopped, cannot harvest!")
                     GPIO.output(pin, GPIO.LOW)
                     return
-                    
-                flow_rate_lph = self._cfg["pump"].max_flow_rate_lph * (speed_pct / 100.0)
-                duration_s = (volume_l / flow_rate_lph) * 3600.0
-                logger.info(f"Harvesting {volume_l:.1f}L @ {flow_rate_lph:.1f} L/hr... waiting {duration_s:.1f}s")
-                
-                # 3. Wait for harvest volume to pass
-                await asyncio.sleep(duration_s)
-                
+
+                flow_rate_lph = self._max_flow_lph * (speed_pct / 100.0)
+                expected_s = (volume_l / flow_rate_lph) * 3600.0
+                logger.info(
+                    "Harvesting %.1fL @ %.1f L/hr... ~%.1fs expected",
+                    volume_l, flow_rate_lph, expected_s,
+                )
+
+                # 3. Integrate delivered volume against the live pump speed
+                # instead of sleeping a precomputed duration — a mid-harvest
+                # speed change (e.g. pH shock transition) would otherwise
+                # deliver the wrong volume. Hard 2x-expected bound as safety.
+                delivered = 0.0
+                start = last = time.monotonic()
+                while delivered < volume_l:
+                    await asyncio.sleep(5.0)
+                    now = time.monotonic()
+                    flow_lph = self._max_flow_lph * self._pump.speed_percent / 100.0
+                    delivered += flow_lph * (now - last) / 3600.0
+                    last = now
+                    if now - start > 2.0 * expected_s:
+                        logger.error(
+                            f"Harvest overran 2x expected duration "
+                            f"({delivered:.1f}L of {volume_l:.1f}L delivered), closing valve"
+                        )
+                        break
+
                 # 4. Close valve
                 logger.info(f"Closing harvest valve on GPIO {pin}")
                 GPIO.output(pin, GPIO.LOW)
                 
                 # 5. Draw fresh media to restore reactor volume
                 logger.info("Harvest complete. Drawing fresh media (gravity top-up).")
-                
-            except ImportError:
-                logger.warning("RPi.GPIO not found (simulation mode) — Harvest simulated.")
-                await asyncio.sleep(5.0)
-                logger.info("Simulated harvest complete.")
-                
+
+            except (RuntimeError, OSError) as exc:
+                logger.error(f"Harvest valve GPIO error: {exc}")
+
         finally:
             self._is_harvesting = False
 
+    def _on_harvest_done(self, task: asyncio.Task):
+        """Surface exceptions from the background harvest task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Harvest task failed: {exc}")
+
     async def trigger_ph_shock(self):
         """
         Manually trigger a pH Shock contamination response (SOP-104).
@@ -406,11 +526,25 @@ class OpenCycloOrchestrator:
         logger.info("Initiating graceful shutdown...")
         await self._transition_to(OperatingState.SHUTDOWN)
 
-        # Cancel all subsystem tasks
+        # Let the webhook worker drain the queue (including the SHUTDOWN
+        # notification just enqueued) before we cancel it — cancelling
+        # first would drop anything still pending
+        try:
+            await asyncio.wait_for(self._webhook_q.join(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning("Webhook queue did not drain within 5s")
+
+        # Cancel all subsystem tasks; we only need cancellation to land,
+        # not the task results, so a bounded wait beats gathering them
         for task in self._tasks:
             task.cancel()
         if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+            _, pending = await asyncio.wait(self._tasks, timeout=5.0)
+            for task in pending:
+                logger.warning(f"Task {task.get_name()} failed to cancel within 5s")
+
+        # Close the shared webhook HTTP session
+        await close_webhook()
 
         # Cleanup hardware
         self._ph_stat.cleanup()
@@ -442,16 +576,29 @@ async def main():
     loop = asyncio.get_running_loop()
     shutdown_event = asyncio.Event()
 
+    # All blocking hardware calls (GPIO/I2C/Modbus init, sensor reads) go
+    # through run_in_executor(None, ...); bound that pool to two threads
+    # instead of the stdlib default min(32, cpu+4) — on a Pi the default
+    # spawns ~8 idle threads for a handful of occasional calls
+    hw_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="opencyclo-hw",
+    )
+    loop.set_default_executor(hw_executor)
+
     def _signal_handler():
         logger.info("Received shutdown signal")
         shutdown_event.set()
 
+    # Windows doesn't support add_signal_handler for all signals;
+    # one shared fallback handler instead of a closure per signal
+    def _win_handler(signum, frame):
+        _signal_handler()
+
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
             loop.add_signal_handler(sig, _signal_handler)
         except NotImplementedError:
-            # Windows doesn't support add_signal_handler for all signals
-            signal.signal(sig, lambda s, f: _signal_handler())
+            signal.signal(sig, _win_handler)
 
     try:
         await orchestrator.initialize()
@@ -473,6 +620,10 @@ async def main():
         logger.exception(f"Fatal error: {exc}")
     finally:
         await orchestrator.shutdown()
+        hw_executor.shutdown(wait=False)
+        listener = getattr(logger, "_queue_listener", None)
+        if listener is not None:
+            listener.stop()  # Flush queued records before exit
 
 
 def cli():
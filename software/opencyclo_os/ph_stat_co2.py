@@ -19,10 +19,12 @@ Garage reference: OPENCYCLO V0.1-ALPHA §3 Test A
 
 import asyncio
 import logging
+import threading
 import time
+from collections import deque
 from typing import Optional
 
-from simple_pid import PID
+import numpy as np
 
 from config import (
     ACTIVE_PROFILE,
@@ -32,8 +34,37 @@ from config import (
 )
 from utils.logger import log_sensor_data
 
+# Hardware libraries imported once at module load — re-running these
+# imports inside each sensor's _init_hardware re-entered the import
+# machinery under the GIL on every warm boot
+try:
+    import board
+    import busio
+    import adafruit_ads1x15.ads1115 as ADS
+    from adafruit_ads1x15.analog_in import AnalogIn
+    ADS1115_AVAILABLE = True
+except ImportError:
+    ADS1115_AVAILABLE = False
+
+try:
+    import smbus2
+    SMBUS_AVAILABLE = True
+except ImportError:
+    SMBUS_AVAILABLE = False
+
 logger = logging.getLogger("opencyclo")
 
+# Shared I2C bus handle — created on first use, reused across sensors
+_i2c_bus = None
+
+
+def _get_i2c():
+    """Return the process-wide busio.I2C instance, creating it lazily."""
+    global _i2c_bus
+    if _i2c_bus is None:
+        _i2c_bus = busio.I2C(board.SCL, board.SDA)
+    return _i2c_bus
+
 # ──────────────────────────────────────────────
 # Hardware Abstraction Layer
 # ──────────────────────────────────────────────
@@ -55,42 +86,75 @@ class GaragePHSensor(PHSensorBase):
       - Linear interpolation: pH = slope * voltage + offset
     """
 
+    # ADC poll rate for the background sampling thread
+    POLL_INTERVAL_S = 0.01  # 100 Hz
+
     def __init__(self):
         self._adc = None
         self._channel = None
         # Default calibration — MUST be calibrated with buffer solutions
         self._slope = -5.7       # mV/pH (typical for DF-Robot V2)
         self._offset = 21.34     # Voltage at pH 0 intercept
+        # Oversampling window filled by the polling thread; deque append
+        # is atomic so read_ph can snapshot it without a lock
+        self._samples: deque = deque(maxlen=16)
+        self._poll_thread: Optional[threading.Thread] = None
+        self._polling = False
 
     async def initialize(self):
         """Initialize the ADS1115 ADC. Runs in executor to avoid blocking."""
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._init_hardware)
+        if self._channel is not None:
+            # Dedicated daemon thread polls the ADC continuously so
+            # read_ph never pays a per-call executor hop for I2C
+            self._polling = True
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop, name="ph-adc-poll", daemon=True
+            )
+            self._poll_thread.start()
 
     def _init_hardware(self):
+        if not ADS1115_AVAILABLE:
+            logger.info("ADS1115 libraries unavailable, using simulated pH sensor")
+            self._channel = None
+            return
         try:
-            import board
-            import busio
-            import adafruit_ads1x15.ads1115 as ADS
-            from adafruit_ads1x15.analog_in import AnalogIn
-
-            i2c = busio.I2C(board.SCL, board.SDA)
-            ads = ADS.ADS1115(i2c)
+            ads = ADS.ADS1115(_get_i2c())
             self._channel = AnalogIn(ads, ADS.P0)
             logger.info("Garage pH sensor (ADS1115) initialized on I2C")
-        except (ImportError, Exception) as exc:
+        except (RuntimeError, OSError, ValueError) as exc:
             logger.warning(f"ADS1115 init failed ({exc}), using simulated pH sensor")
             self._channel = None
 
+    def _poll_loop(self):
+        """Continuously sample the ADC into the oversampling window."""
+        channel = self._channel
+        samples = self._samples
+        interval = self.POLL_INTERVAL_S
+        while self._polling:
+            try:
+                samples.append(channel.voltage)
+            except OSError as exc:
+                logger.warning("ADC read error in poll thread: %s", exc)
+            time.sleep(interval)
+
     async def read_ph(self) -> float:
         if self._channel is None:
             # Simulated: slowly drift pH upward (algae consuming CO₂)
             return 7.0 + 0.3 * (time.monotonic() % 60) / 60.0
 
-        loop = asyncio.get_running_loop()
-        voltage = await loop.run_in_executor(None, lambda: self._channel.voltage)
-        ph = self._slope * voltage + self._offset
-        return round(max(0.0, min(14.0, ph)), 2)
+        voltages = np.asarray(self._samples, dtype=np.float32)
+        if voltages.size == 0:
+            # Poll thread hasn't produced a sample yet
+            return 7.0
+        # Vectorized convert + clamp; median rejects single-sample spikes
+        phs = np.clip(self._slope * voltages + self._offset, 0.0, 14.0)
+        return round(float(np.median(phs)), 2)
+
+    def stop_polling(self):
+        """Signal the ADC polling thread to exit (daemon; no join needed)."""
+        self._polling = False
 
 
 class IndustrialPHSensor(PHSensorBase):
@@ -112,11 +176,14 @@ class IndustrialPHSensor(PHSensorBase):
         await loop.run_in_executor(None, self._init_hardware)
 
     def _init_hardware(self):
+        if not SMBUS_AVAILABLE:
+            logger.info("smbus2 unavailable, using simulated pH sensor")
+            self._bus = None
+            return
         try:
-            import smbus2
             self._bus = smbus2.SMBus(self._bus_number)
             logger.info(f"Atlas Scientific pH sensor initialized on I2C bus {self._bus_number}")
-        except (ImportError, Exception) as exc:
+        except (OSError, ValueError) as exc:
             logger.warning(f"smbus2 init failed ({exc}), using simulated pH sensor")
             self._bus = None
 
@@ -124,24 +191,33 @@ class IndustrialPHSensor(PHSensorBase):
         if self._bus is None:
             return 6.8 + 0.2 * (time.monotonic() % 30) / 30.0
 
+        # The EZO protocol is write → wait ~900ms → read. The wait is pure
+        # time, not CPU, so it runs on the event loop rather than holding
+        # an executor thread hostage for the better part of a second.
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._read_atlas)
-
-    def _read_atlas(self) -> float:
         try:
-            # Send 'R' (read) command
-            self._bus.write_byte(self.I2C_ADDRESS, ord('R'))
-            time.sleep(0.9)  # Atlas EZO needs ~900ms for pH reading
-            # Read response (max 31 bytes)
-            raw = self._bus.read_i2c_block_data(self.I2C_ADDRESS, 0x00, 31)
-            if raw[0] == 1:  # Success code
-                ph_str = "".join(chr(b) for b in raw[1:] if b != 0)
-                return round(float(ph_str), 2)
-            return 7.0  # Fallback
+            await loop.run_in_executor(None, self._send_read_cmd)
+            await asyncio.sleep(0.9)  # Atlas EZO needs ~900ms for pH reading
+            return await loop.run_in_executor(None, self._fetch_result)
         except Exception as exc:
             logger.error(f"Atlas pH read error: {exc}")
             return 7.0
 
+    def _send_read_cmd(self):
+        """Issue the EZO 'R' (read) command."""
+        self._bus.write_byte(self.I2C_ADDRESS, ord('R'))
+
+    def _fetch_result(self) -> float:
+        """Read back and parse the pending EZO response."""
+        # Read response (max 31 bytes)
+        raw = self._bus.read_i2c_block_data(self.I2C_ADDRESS, 0x00, 31)
+        if raw[0] == 1:  # Success code
+            # The payload is ASCII padded with NULs — strip them in C
+            # rather than filtering byte-by-byte in Python
+            ph_str = bytes(raw[1:]).rstrip(b"\x00")
+            return round(float(ph_str), 2)
+        return 7.0  # Fallback
+
 
 # ──────────────────────────────────────────────
 # CO₂ Valve Control
@@ -153,6 +229,7 @@ class CO2Valve:
     def __init__(self, relay_pin: int):
         self._pin = relay_pin
         self._gpio = None
+        self._pwm = None
         self._is_open = False
 
     async def initialize(self):
@@ -165,38 +242,112 @@ class CO2Valve:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self._pin, GPIO.OUT, initial=GPIO.LOW)
             self._gpio = GPIO
+            if ACTIVE_PROFILE == Profile.INDUSTRIAL:
+                # Proportional dosing: let the GPIO library generate the
+                # waveform so the asyncio loop never has to tick the pin
+                self._pwm = GPIO.PWM(self._pin, 100)
+                self._pwm.start(0)
             logger.info(f"CO₂ solenoid valve initialized on GPIO {self._pin}")
         except (ImportError, Exception) as exc:
             logger.warning(f"GPIO init failed ({exc}), using simulated CO₂ valve")
             self._gpio = None
 
     def open(self):
-        """Open the CO₂ valve (energize solenoid)."""
+        """Open the CO₂ valve fully (energize solenoid / 100% duty)."""
         if not self._is_open:
-            if self._gpio:
+            if self._pwm:
+                self._pwm.ChangeDutyCycle(100.0)
+            elif self._gpio:
                 self._gpio.output(self._pin, self._gpio.HIGH)
             self._is_open = True
             logger.debug("CO₂ valve OPENED")
 
     def close(self):
-        """Close the CO₂ valve (de-energize solenoid)."""
+        """Close the CO₂ valve (de-energize solenoid / 0% duty)."""
         if self._is_open:
-            if self._gpio:
+            if self._pwm:
+                self._pwm.ChangeDutyCycle(0.0)
+            elif self._gpio:
                 self._gpio.output(self._pin, self._gpio.LOW)
             self._is_open = False
             logger.debug("CO₂ valve CLOSED")
 
+    def set_duty(self, pct: float):
+        """Set the proportional PWM duty cycle (0–100%)."""
+        pct = max(0.0, min(100.0, pct))
+        if self._pwm:
+            self._pwm.ChangeDutyCycle(pct)
+        self._is_open = pct > 0.0
+
     @property
     def is_open(self) -> bool:
         return self._is_open
 
     def cleanup(self):
         """Release GPIO resources."""
+        if self._pwm:
+            self._pwm.stop()
+            self._pwm = None
         self.close()
         if self._gpio:
             self._gpio.cleanup(self._pin)
 
 
+# ──────────────────────────────────────────────
+# Incremental PID
+# ──────────────────────────────────────────────
+
+class IncrementalPID:
+    """
+    Velocity-form (incremental) PID controller.
+
+    Computes Δu = Kp·(e−e₁) + Ki·Ts·e + (Kd/Ts)·(e − 2e₁ + e₂) and
+    accumulates it into a clamped output. There is no explicit integrator
+    to wind up during a pH-shock hold: reset() zeroes three scalars and
+    the next step resumes bumplessly from a zero output.
+    """
+
+    __slots__ = ("kp", "bi", "bd", "out_min", "out_max", "e1", "e2", "u")
+
+    def __init__(
+        self,
+        kp: float,
+        ki: float,
+        kd: float,
+        sample_time_s: float,
+        output_limits: tuple[float, float] = (0.0, 100.0),
+    ):
+        self.kp = kp
+        self.bi = ki * sample_time_s   # integral contribution per step
+        self.bd = kd / sample_time_s   # derivative contribution per step
+        self.out_min, self.out_max = output_limits
+        self.e1 = 0.0
+        self.e2 = 0.0
+        self.u = 0.0
+
+    def step(self, error: float) -> float:
+        """Advance one sample with the given error; returns the clamped output."""
+        u = self.u + (
+            self.kp * (error - self.e1)
+            + self.bi * error
+            + self.bd * (error - 2.0 * self.e1 + self.e2)
+        )
+        if u > self.out_max:
+            u = self.out_max
+        elif u < self.out_min:
+            u = self.out_min
+        self.u = u
+        self.e2 = self.e1
+        self.e1 = error
+        return u
+
+    def reset(self):
+        """Zero the controller state."""
+        self.e1 = 0.0
+        self.e2 = 0.0
+        self.u = 0.0
+
+
 # ──────────────────────────────────────────────
 # pH-Stat Controller
 # ──────────────────────────────────────────────
@@ -223,13 +374,20 @@ class PHStatController:
 
         self._valve = CO2Valve(self._co2_cfg.relay_pin)
 
-        # PID controller
-        self._pid = PID(
-            Kp=self._ph_cfg.kp,
-            Ki=self._ph_cfg.ki,
-            Kd=self._ph_cfg.kd,
-            setpoint=self._ph_cfg.setpoint,
-            output_limits=(0, 100),  # 0-100% valve opening
+        # Incremental PID controller (windup-free by construction)
+        self._pid = IncrementalPID(
+            kp=self._ph_cfg.kp,
+            ki=self._ph_cfg.ki,
+            kd=self._ph_cfg.kd,
+            sample_time_s=self._ph_cfg.sample_interval_s,
+            output_limits=(0.0, 100.0),  # 0-100% valve opening
+        )
+
+        # Profile is fixed at startup — bind the actuation strategy once
+        # instead of re-testing ACTIVE_PROFILE on every control tick
+        self._actuate = (
+            self._actuate_garage if ACTIVE_PROFILE == Profile.GARAGE
+            else self._actuate_industrial
         )
 
         # State
@@ -238,6 +396,12 @@ class PHStatController:
         self._shock_task: Optional[asyncio.Task] = None
         self._latest_ph: float = 7.0
 
+        # Adaptive sampling: a quiet steady state stretches the period
+        # (each Atlas read costs ~900ms of wall time and probe wear), a
+        # disturbance snaps it back to the configured base interval
+        self._adaptive_interval: float = self._ph_cfg.sample_interval_s
+        self._quiet_ticks: int = 0
+
     async def initialize(self):
         """Initialize sensor and valve hardware."""
         await self._sensor.initialize()
@@ -267,10 +431,15 @@ class PHStatController:
         logger.info("pH-Stat control loop STARTED")
 
         try:
+            # Schedule against an absolute deadline so sensor latency
+            # (up to ~900ms on the Atlas probe) doesn't stretch the
+            # effective sampling period the PID gains were tuned for
+            next_deadline = time.monotonic()
             while self._running:
                 # Skip PID during pH Shock override
                 if self._shock_active:
                     await asyncio.sleep(self._ph_cfg.sample_interval_s)
+                    next_deadline = time.monotonic()
                     continue
 
                 # Read pH
@@ -281,23 +450,33 @@ class PHStatController:
                 # PID computation
                 # PID error = setpoint - measured
                 # Positive output = pH is too high = need more CO₂
-                output = self._pid(ph)
-
-                # Garage: simple relay threshold
-                if ACTIVE_PROFILE == Profile.GARAGE:
-                    if ph > self._ph_cfg.high_threshold:
-                        self._valve.open()
-                    elif ph < self._ph_cfg.low_threshold:
-                        self._valve.close()
+                valve_was_open = self._valve.is_open
+                output = self._pid.step(self._ph_cfg.setpoint - ph)
+                self._actuate(output, ph)
+
+                # Adapt the sampling period: within ±0.05 pH of setpoint
+                # with no valve change, back off up to 4x the base rate
+                base = self._ph_cfg.sample_interval_s
+                if (
+                    abs(ph - self._ph_cfg.setpoint) < 0.05
+                    and self._valve.is_open == valve_was_open
+                ):
+                    self._quiet_ticks += 1
+                    self._adaptive_interval = min(
+                        4.0 * base, base * (1 + self._quiet_ticks // 4)
+                    )
                 else:
-                    # Industrial: proportional control
-                    # TODO: PWM duty cycle = output / 100
-                    if output > 5.0:  # >5% → open valve
-                        self._valve.open()
-                    else:
-                        self._valve.close()
-
-                await asyncio.sleep(self._ph_cfg.sample_interval_s)
+                    self._quiet_ticks = 0
+                    self._adaptive_interval = base
+
+                next_deadline += self._adaptive_interval
+                delay = next_deadline - time.monotonic()
+                if delay < 0:
+                    # Work overran the period — drop the frame and resync
+                    logger.warning("pH-stat tick overran by %.3fs, resyncing", -delay)
+                    next_deadline = time.monotonic()
+                    delay = 0.0
+                await asyncio.sleep(delay)
 
         except asyncio.CancelledError:
             logger.info("pH-Stat control loop cancelled")
@@ -309,6 +488,17 @@ class PHStatController:
         """Signal the control loop to stop."""
         self._running = False
 
+    def _actuate_garage(self, output: float, ph: float):
+        """Garage: simple relay threshold around the deadband."""
+        if ph > self._ph_cfg.high_threshold:
+            self._valve.open()
+        elif ph < self._ph_cfg.low_threshold:
+            self._valve.close()
+
+    def _actuate_industrial(self, output: float, ph: float):
+        """Industrial: proportional PWM dosing of the 24V solenoid."""
+        self._valve.set_duty(output)
+
     # ── pH Shock Override (SOP-104) ──────────
 
     async def override_ph_shock(
@@ -348,6 +538,7 @@ class PHStatController:
             logger.warning(f"pH Shock: reached {target}, holding for {hours} hours")
             hold_seconds = hours * 3600
             start = time.monotonic()
+            next_deadline = time.monotonic()
             while (time.monotonic() - start) < hold_seconds:
                 ph = await self._sensor.read_ph()
                 self._latest_ph = ph
@@ -359,7 +550,12 @@ class PHStatController:
                 elif ph < target - 0.2:
                     self._valve.close()
 
-                await asyncio.sleep(self._ph_cfg.sample_interval_s)
+                next_deadline += self._ph_cfg.sample_interval_s
+                delay = next_deadline - time.monotonic()
+                if delay < 0:
+                    next_deadline = time.monotonic()
+                    delay = 0.0
+                await asyncio.sleep(delay)
 
             # Phase 3: Restore normal operation
             self._valve.close()
@@ -370,10 +566,12 @@ class PHStatController:
             logger.warning("pH Shock override was cancelled")
         finally:
             self._shock_active = False
-            # Reset PID integrator to avoid windup
+            # Reset controller state for a bumpless restart
             self._pid.reset()
 
     def cleanup(self):
         """Release hardware resources."""
         self.stop()
+        if isinstance(self._sensor, GaragePHSensor):
+            self._sensor.stop_polling()
         self._valve.cleanup()
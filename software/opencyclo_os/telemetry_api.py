@@ -22,26 +22,33 @@ Spec reference: Cyclo-Earth §4 (FastAPI Backend)
 
 import asyncio
 import json
+import math
 import time
-from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+
 try:
     from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, Response
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: C-accelerated JSON for the bulk history endpoint
+
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from config import ACTIVE_PROFILE, OperatingState, get_config
+from config import ACTIVE_PROFILE, OperatingState
 
 
 # ──────────────────────────────────────────────
@@ -52,50 +59,116 @@ class TelemetryStore:
     """
     Thread-safe in-memory ring buffer for telemetry data.
     Stores the last N readings per metric for the history API.
+
+    Each metric is a pair of preallocated float64 arrays (timestamps and
+    values) with a head index — the old deque-of-dicts layout kept ~32k
+    Python dicts resident; the flat arrays are ~30x smaller and history
+    reads become contiguous NumPy slices.
     """
 
+    METRICS = (
+        "ph",
+        "density_g_l",
+        "green_ratio",
+        "led_freq_hz",
+        "led_duty_pct",
+        "pump_speed_pct",
+        "pump_freq_hz",
+        "temperature_c",
+        "co2_valve_open",
+    )
+
     def __init__(self, max_history: int = 3600):
         self._max = max_history
-        self._data: dict[str, deque] = {
-            "ph": deque(maxlen=max_history),
-            "density_g_l": deque(maxlen=max_history),
-            "green_ratio": deque(maxlen=max_history),
-            "led_freq_hz": deque(maxlen=max_history),
-            "led_duty_pct": deque(maxlen=max_history),
-            "pump_speed_pct": deque(maxlen=max_history),
-            "pump_freq_hz": deque(maxlen=max_history),
-            "temperature_c": deque(maxlen=max_history),
-            "co2_valve_open": deque(maxlen=max_history),
+        self._ts: dict[str, np.ndarray] = {
+            m: np.empty(max_history, np.float64) for m in self.METRICS
+        }
+        self._val: dict[str, np.ndarray] = {
+            m: np.empty(max_history, np.float64) for m in self.METRICS
         }
+        self._head: dict[str, int] = {m: 0 for m in self.METRICS}
+        self._count: dict[str, int] = {m: 0 for m in self.METRICS}
+        # Incremental running stats, maintained on push so means and
+        # variances never require scanning the buffers
+        self._sum: dict[str, float] = {m: 0.0 for m in self.METRICS}
+        self._sumsq: dict[str, float] = {m: 0.0 for m in self.METRICS}
         self._state = OperatingState.IDLE
         self._state_since: float = time.time()
         self._latest: dict = {}
+        # ISO timestamp cache: snapshots for all WS clients in one tick
+        # share a single strftime instead of one datetime per call
+        self._cached_ts_epoch: float = 0.0
+        self._cached_ts_iso: str = ""
+        # TTL cache for the /api/v1/co2 response (density only changes
+        # at the 0.5s push rate; dashboards poll much faster)
+        self._co2_cache: Optional[dict] = None
+        self._co2_cache_epoch: float = 0.0
 
     def push(self, metric: str, value: float, timestamp: Optional[float] = None):
-        ts = timestamp or time.time()
-        entry = {"ts": ts, "value": value}
-        if metric in self._data:
-            self._data[metric].append(entry)
+        ts_arr = self._ts.get(metric)
+        if ts_arr is not None:
+            head = self._head[metric]
+            if self._count[metric] == self._max:
+                # Evict the overwritten value from the running sums
+                old = self._val[metric][head]
+                self._sum[metric] -= old
+                self._sumsq[metric] -= old * old
+            else:
+                self._count[metric] += 1
+            ts_arr[head] = timestamp or time.time()
+            self._val[metric][head] = value
+            self._head[metric] = (head + 1) % self._max
+            self._sum[metric] += value
+            self._sumsq[metric] += value * value
         self._latest[metric] = value
 
+    def get_mean(self, metric: str) -> float:
+        """O(1) mean over the retained history window."""
+        n = self._count.get(metric)
+        if not n:
+            return 0.0
+        return self._sum[metric] / n
+
+    def get_std(self, metric: str) -> float:
+        """O(1) population standard deviation over the retained window."""
+        n = self._count.get(metric)
+        if not n:
+            return 0.0
+        mean = self._sum[metric] / n
+        return math.sqrt(max(0.0, self._sumsq[metric] / n - mean * mean))
+
     def set_state(self, state: OperatingState):
         self._state = state
         self._state_since = time.time()
 
     def get_history(self, metric: str, limit: int = 100) -> list[dict]:
-        if metric not in self._data:
+        count = self._count.get(metric)
+        if count is None:
             return []
-        items = list(self._data[metric])
-        return items[-limit:]
+        n = min(limit, count)
+        if n == 0:
+            return []
+        # Gather the newest n entries (oldest first), wrapping around the
+        # ring; the modulo index vector handles both the pre-wrap and
+        # steady-state cases
+        head = self._head[metric]
+        idx = np.arange(head - n, head) % self._max
+        ts = self._ts[metric][idx].tolist()
+        vals = self._val[metric][idx].tolist()
+        return [{"ts": t, "value": v} for t, v in zip(ts, vals)]
 
     def get_snapshot(self) -> dict:
+        now = time.time()
+        if now - self._cached_ts_epoch > 0.1:
+            self._cached_ts_epoch = now
+            self._cached_ts_iso = datetime.now(timezone.utc).isoformat()
         return {
             "profile": ACTIVE_PROFILE.name,
             "state": self._state.name,
             "state_since": self._state_since,
-            "uptime_s": time.time() - self._state_since,
+            "uptime_s": now - self._state_since,
             "metrics": {k: v for k, v in self._latest.items()},
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._cached_ts_iso,
             "node": {
                 "id": "CONTES_ALPHA_01",
                 "lat": 43.8113,
@@ -107,31 +180,46 @@ class TelemetryStore:
 
 telemetry = TelemetryStore()
 
-# Connected WebSocket clients
-ws_clients: set[WebSocket] = set()
+# Connected WebSocket clients. Copy-on-write: the broadcast loop grabs the
+# current list reference and iterates it lock-free; connect/disconnect
+# build a new list under the lock and swap the reference atomically.
+ws_clients: list = []
+ws_clients_lock = asyncio.Lock()
 
 
 # ──────────────────────────────────────────────
 # Simulated Telemetry Producer
 # ──────────────────────────────────────────────
 
+# Precomputed waveform tables: one vectorized evaluation at import
+# replaces the per-tick math.sin calls. 7200s of samples at the 0.5s
+# tick — the producer cycles through them by index.
+_SIM_TICK_S = 0.5
+_SIM_T = np.arange(0.0, 7200.0, _SIM_TICK_S)
+_SIM_PH = np.round(6.8 + 0.15 * np.sin(_SIM_T * 0.1) + 0.02 * np.sin(_SIM_T * 0.7), 3)
+_SIM_TEMP = np.round(24.0 + 1.5 * np.sin(_SIM_T * 0.05), 1)
+
+
 async def simulate_telemetry():
     """
     Produces fake telemetry data for development/demo.
     In production, this is replaced by main_loop.py pushing real data.
     """
-    import math
+    global ws_clients
+
     t0 = time.time()
     telemetry.set_state(OperatingState.LOGARITHMIC_GROWTH)
+    n_samples = len(_SIM_PH)
 
     while True:
         t = time.time() - t0
+        i = int(t / _SIM_TICK_S) % n_samples
 
-        # Simulated pH: oscillates around 6.8
-        ph = 6.8 + 0.15 * math.sin(t * 0.1) + 0.02 * math.sin(t * 0.7)
-        telemetry.push("ph", round(ph, 3))
+        # Simulated pH: oscillates around 6.8 (table lookup)
+        ph = float(_SIM_PH[i])
+        telemetry.push("ph", ph)
 
-        # Simulated density: slowly growing
+        # Simulated density: slowly growing (monotonic, so computed live)
         density = 0.5 + 3.0 * (1 - math.exp(-t / 600))
         telemetry.push("density_g_l", round(density, 3))
 
@@ -148,21 +236,28 @@ async def simulate_telemetry():
         telemetry.push("pump_freq_hz", 32.5)
 
         # Temperature
-        temp = 24.0 + 1.5 * math.sin(t * 0.05)
-        telemetry.push("temperature_c", round(temp, 1))
+        telemetry.push("temperature_c", float(_SIM_TEMP[i]))
 
         # CO2 valve
         telemetry.push("co2_valve_open", 1.0 if ph > 6.85 else 0.0)
 
-        # Broadcast to WebSocket clients
-        snapshot = telemetry.get_snapshot()
-        dead = set()
-        for ws in ws_clients:
-            try:
-                await ws.send_json(snapshot)
-            except Exception:
-                dead.add(ws)
-        ws_clients -= dead
+        # Broadcast to WebSocket clients: serialize the snapshot once and
+        # fan out concurrently, so N clients cost one json.dumps and a
+        # slow client doesn't head-of-line block the others
+        clients = ws_clients  # lock-free snapshot of the COW list
+        if clients:
+            payload = json.dumps(telemetry.get_snapshot(), separators=(",", ":"))
+            results = await asyncio.gather(
+                *(ws.send_text(payload) for ws in clients),
+                return_exceptions=True,
+            )
+            dead = {
+                ws for ws, result in zip(clients, results)
+                if isinstance(result, Exception)
+            }
+            if dead:
+                async with ws_clients_lock:
+                    ws_clients = [c for c in ws_clients if c not in dead]
 
         await asyncio.sleep(0.5)  # 2Hz update rate
 
@@ -212,30 +307,39 @@ if FASTAPI_AVAILABLE:
                 status_code=404,
                 content={"error": f"Unknown metric: {metric}"},
             )
-        return JSONResponse(content={
+        body = {
             "metric": metric,
             "count": len(data),
             "data": data,
-        })
+        }
+        if orjson is not None:
+            # Bulk endpoint: up to 3600 entries — orjson serializes the
+            # homogeneous float dicts several times faster than stdlib json
+            return Response(orjson.dumps(body), media_type="application/json")
+        return JSONResponse(content=body)
 
     @app.get("/api/v1/metrics")
     async def list_metrics():
         """List all available telemetry metrics."""
         return JSONResponse(content={
-            "metrics": list(telemetry._data.keys()),
+            "metrics": list(TelemetryStore.METRICS),
         })
 
     @app.websocket("/ws/telemetry")
     async def websocket_telemetry(ws: WebSocket):
         """Real-time WebSocket telemetry stream."""
+        global ws_clients
+
         await ws.accept()
-        ws_clients.add(ws)
+        async with ws_clients_lock:
+            ws_clients = ws_clients + [ws]
         try:
             while True:
                 # Keep connection alive; client doesn't need to send anything
                 await ws.receive_text()
         except WebSocketDisconnect:
-            ws_clients.discard(ws)
+            async with ws_clients_lock:
+                ws_clients = [c for c in ws_clients if c is not ws]
 
     @app.get("/api/v1/co2")
     async def get_co2_stats():
@@ -243,28 +347,34 @@ if FASTAPI_AVAILABLE:
         Cumulative CO₂ sequestration estimate.
         Used by Cyclo-Earth Reality Sync module.
         """
-        density_history = telemetry.get_history("density_g_l", limit=3600)
-        if not density_history:
-            return JSONResponse(content={
+        now = time.time()
+        if telemetry._co2_cache is not None and now - telemetry._co2_cache_epoch < 0.5:
+            return JSONResponse(content=telemetry._co2_cache)
+
+        latest_density = telemetry._latest.get("density_g_l")
+        if latest_density is None:
+            body = {
                 "co2_kg_total": 0.0,
                 "co2_kg_today": 0.0,
-            })
-
-        # Rough estimate: 1g algae sequesters ~1.83g CO₂ (stoichiometric)
-        # Using the latest density * reactor volume * stoichiometric ratio
-        cfg = get_config()
-        reactor_volume_l = 19.0 if ACTIVE_PROFILE.name == "GARAGE" else 1000.0
-        latest_density = density_history[-1]["value"]
-        biomass_kg = latest_density * reactor_volume_l / 1000.0
-        co2_kg = biomass_kg * 1.83  # CO₂ fixation ratio
-
-        return JSONResponse(content={
-            "co2_kg_total": round(co2_kg, 3),
-            "co2_kg_today": round(co2_kg * 0.1, 3),  # Placeholder daily rate
-            "reactor_volume_l": reactor_volume_l,
-            "biomass_density_g_l": latest_density,
-            "stoichiometric_ratio": 1.83,
-        })
+            }
+        else:
+            # Rough estimate: 1g algae sequesters ~1.83g CO₂ (stoichiometric)
+            # Using the latest density * reactor volume * stoichiometric ratio
+            reactor_volume_l = 19.0 if ACTIVE_PROFILE.name == "GARAGE" else 1000.0
+            biomass_kg = latest_density * reactor_volume_l / 1000.0
+            co2_kg = biomass_kg * 1.83  # CO₂ fixation ratio
+
+            body = {
+                "co2_kg_total": round(co2_kg, 3),
+                "co2_kg_today": round(co2_kg * 0.1, 3),  # Placeholder daily rate
+                "reactor_volume_l": reactor_volume_l,
+                "biomass_density_g_l": latest_density,
+                "stoichiometric_ratio": 1.83,
+            }
+
+        telemetry._co2_cache = body
+        telemetry._co2_cache_epoch = now
+        return JSONResponse(content=body)
 
 else:
     # Stub when FastAPI is not installed
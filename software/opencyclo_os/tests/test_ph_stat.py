@@ -17,7 +17,30 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from ph_stat_co2 import PHStatController, GaragePHSensor, CO2Valve
+from ph_stat_co2 import PHStatController, GaragePHSensor, CO2Valve, IncrementalPID
+
+
+class TestIncrementalPID:
+    """Test the velocity-form PID controller."""
+
+    def test_output_is_clamped(self):
+        pid = IncrementalPID(kp=10.0, ki=1.0, kd=0.0, sample_time_s=1.0)
+        assert pid.step(100.0) == 100.0
+        assert pid.step(-100.0) == 0.0
+
+    def test_positive_error_raises_output(self):
+        pid = IncrementalPID(kp=2.0, ki=0.1, kd=0.05, sample_time_s=1.0)
+        out = pid.step(0.5)
+        assert out > 0.0
+
+    def test_reset_zeroes_state(self):
+        pid = IncrementalPID(kp=2.0, ki=0.1, kd=0.05, sample_time_s=1.0)
+        pid.step(1.0)
+        pid.step(2.0)
+        pid.reset()
+        assert pid.e1 == 0.0
+        assert pid.e2 == 0.0
+        assert pid.u == 0.0
 
 
 class TestGaragePHSensor:
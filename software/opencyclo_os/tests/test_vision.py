@@ -2,7 +2,7 @@
 OpenCyclo OS — Unit Tests: Vision Density Sensor
 =================================================
 
-Tests for vision_density.py: frame capture, HSV analysis, density mapping.
+Tests for vision_density.py: frame capture, BGR ratio analysis, density mapping.
 Uses simulated camera (no physical hardware required).
 """
 
@@ -25,29 +25,26 @@ class TestVisionDensitySensor:
         await sensor.initialize()
         # Should not raise; camera should fall through to simulation mode
 
-    @pytest.mark.asyncio
-    async def test_simulated_frame_is_valid(self):
+    def test_simulated_frame_is_valid(self):
         sensor = VisionDensitySensor()
-        await sensor.initialize()
+        sensor._init_simulated()
         frame = sensor._simulate_frame()
         assert frame is not None
         assert frame.shape[2] == 3  # BGR channels
         assert frame.shape[0] > 0
         assert frame.shape[1] > 0
 
-    @pytest.mark.asyncio
-    async def test_green_ratio_is_positive(self):
+    def test_green_ratio_is_positive(self):
         sensor = VisionDensitySensor()
-        await sensor.initialize()
+        sensor._init_simulated()
         frame = sensor._simulate_frame()
         roi = sensor._extract_roi(frame)
         ratio = sensor._compute_green_ratio(roi)
         assert ratio > 0.0
 
-    @pytest.mark.asyncio
-    async def test_density_is_non_negative(self):
+    def test_density_is_non_negative(self):
         sensor = VisionDensitySensor()
-        await sensor.initialize()
+        sensor._init_simulated()
         density = sensor._ratio_to_density(1.5)
         assert density >= 0.0
 
@@ -10,9 +10,43 @@ post-run analysis and growth curve reconstruction.
 import json
 import logging
 import os
+import queue
 import sys
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Bound encode method of a preconfigured encoder: skips the argument
+# plumbing json.dumps redoes on every call, and compact separators save
+# bytes on disk. orjson (C-accelerated, ~5x faster on these small
+# fixed-shape dicts) is preferred when installed.
+try:
+    import orjson
+
+    def _ENCODE(entry: dict) -> str:
+        return orjson.dumps(entry, default=str).decode()
+except ImportError:
+    _ENCODE = json.JSONEncoder(default=str, separators=(",", ":")).encode
+
+
+# Level-name lookup — avoids getattr on the logging module namespace
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unmodified.
+
+    The stock prepare() formats the record on the producer thread and
+    drops exc_info/args — that re-adds the formatting cost the queue is
+    meant to move off the hot path, and it starves JSONFormatter of the
+    structured "exception" field. Passing the record through untouched
+    is safe because the listener runs in the same process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 class JSONFormatter(logging.Formatter):
@@ -20,7 +54,9 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            # Epoch seconds, already stamped on the record — no datetime
+            # construction per line
+            "ts": record.created,
             "level": record.levelname,
             "module": record.module,
             "func": record.funcName,
@@ -31,7 +67,7 @@ class JSONFormatter(logging.Formatter):
             log_entry["data"] = record.data
         if record.exc_info and record.exc_info[0] is not None:
             log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry, default=str)
+        return _ENCODE(log_entry)
 
 
 def setup_logger(
@@ -57,7 +93,7 @@ def setup_logger(
     os.makedirs(log_dir, exist_ok=True)
 
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    logger.setLevel(_LEVELS.get(log_level.upper(), logging.INFO))
 
     # Prevent duplicate handlers on re-init
     if logger.handlers:
@@ -71,7 +107,6 @@ def setup_logger(
         encoding="utf-8",
     )
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
 
     # ── Console handler (human-readable) ─────
     console_handler = logging.StreamHandler(sys.stdout)
@@ -81,7 +116,18 @@ def setup_logger(
             datefmt="%H:%M:%S",
         )
     )
-    logger.addHandler(console_handler)
+
+    # ── Queue decoupling ─────────────────────
+    # The asyncio loop only pays for a queue put; JSON formatting and
+    # the blocking file/console writes happen on the listener thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(_PassthroughQueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Keep a reference for shutdown (listener.stop() flushes the queue)
+    logger._queue_listener = listener
 
     return logger
 
@@ -103,13 +149,17 @@ def log_sensor_data(
         unit: Unit string (e.g., "pH", "g/L", "Hz").
         **extra: Additional key-value pairs to attach.
     """
+    # Bail before any formatting work when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     record = logger.makeRecord(
         name=logger.name,
         level=logging.INFO,
         fn="",
         lno=0,
-        msg=f"{sensor}: {value:.4f} {unit}",
-        args=(),
+        msg="%s: %.4f %s",
+        args=(sensor, value, unit),
         exc_info=None,
     )
     record.data = {"sensor": sensor, "value": value, "unit": unit, **extra}
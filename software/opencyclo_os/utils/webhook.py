@@ -16,9 +16,36 @@ from typing import Optional
 from urllib.request import Request, urlopen
 from urllib.error import URLError
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # Optional: garage installs fall back to stdlib urllib
+
 
 logger = logging.getLogger("opencyclo")
 
+# Module-level pooled session, created lazily on first send so keep-alive
+# amortizes TCP+TLS setup across bursty alerts
+_session = None
+
+
+async def _get_session():
+    """Return the shared aiohttp.ClientSession, creating it lazily."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+    return _session
+
+
+async def close_webhook():
+    """Close the shared webhook session (call once at daemon shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 
 async def send_webhook(
     url: Optional[str],
@@ -26,12 +53,18 @@ async def send_webhook(
     message: str,
     severity: str = "info",
     data: Optional[dict] = None,
+    session=None,
 ) -> bool:
     """
     Send a webhook notification.
 
-    Uses stdlib urllib to avoid aiohttp dependency in garage mode.
-    Runs the blocking HTTP call in a thread executor to stay async-friendly.
+    When aiohttp is installed, requests go through a shared module-level
+    ClientSession so consecutive alerts reuse one warm connection. Without
+    it, falls back to stdlib urllib in a thread executor (a new connection
+    per call, but no extra dependency for garage installs).
+
+    A caller-owned aiohttp.ClientSession can still be passed via `session`
+    and takes precedence over the shared one.
 
     Args:
         url: Webhook endpoint URL. If None, logs but does not send.
@@ -39,6 +72,7 @@ async def send_webhook(
         message: Human-readable message body.
         severity: One of "info", "warning", "critical".
         data: Additional structured payload.
+        session: Optional aiohttp.ClientSession for connection reuse.
 
     Returns:
         True if sent successfully, False otherwise.
@@ -57,6 +91,20 @@ async def send_webhook(
         logger.info(f"Webhook (no URL configured): [{event}] {message}")
         return False
 
+    if session is None and aiohttp is not None:
+        session = await _get_session()
+
+    if session is not None:
+        try:
+            async with session.post(url, json=payload) as resp:
+                success = resp.status < 400
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+            logger.warning(f"Webhook delivery failed: {exc}")
+            success = False
+        if success:
+            logger.info(f"Webhook sent: [{event}] {message}")
+        return success
+
     def _post():
         try:
             req = Request(
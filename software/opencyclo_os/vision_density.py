@@ -8,8 +8,8 @@ Replaces expensive inline turbidity probes with a camera + math.
 Algorithm:
   1. Capture frame from webcam looking at reactor viewport
   2. Mask to Region of Interest (ROI)
-  3. Convert to HSV color space
-  4. Compute Green channel saturation ratio
+  3. Compute mean BGR channels over the ROI
+  4. Compute Green/Red channel ratio
   5. Map ratio to Dry Weight (g/L) via calibrated polynomial regression
 
 Optionally (INDUSTRIAL profile only):
@@ -20,15 +20,24 @@ Spec reference: technical_specifications.md §2.2
 Garage reference: OPENCYCLO V0.1-ALPHA §3 Test B
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
+import os
 import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import cv2
-import numpy as np
+# cv2 (~200ms) and numpy are deliberately NOT imported at module scope:
+# the garage profile and the config test suite import this module
+# transitively and should not pay the cold-start cost. Methods that need
+# them import locally — after the first call this is a dict lookup.
+if TYPE_CHECKING:
+    import numpy as np
 
 from config import (
     ACTIVE_PROFILE,
@@ -41,30 +50,109 @@ from utils.webhook import send_webhook
 logger = logging.getLogger("opencyclo")
 
 
+def _make_polyval(coeffs):
+    """
+    Build a Horner evaluator specialized to a fixed coefficient tuple.
+
+    Baking the coefficients into the closure removes the per-call array
+    dispatch np.polyval pays; when numba is installed the closure is
+    additionally JIT-compiled (cached across runs) for industrial
+    deployments where this runs thousands of times per session.
+    """
+    coeffs = tuple(float(c) for c in coeffs)
+
+    def _polyval(x: float) -> float:
+        acc = 0.0
+        for c in coeffs:
+            acc = acc * x + c
+        return acc
+
+    try:
+        import numba
+    except ImportError:
+        return _polyval
+    return numba.njit(cache=True)(_polyval)
+
+
 class VisionDensitySensor:
     """
     Asynchronous computer vision soft sensor for biomass density estimation.
 
-    Captures frames from a webcam, analyzes color in HSV space, and maps
-    Green/Red ratio to biomass concentration via a polynomial regression curve.
+    Captures frames from a webcam, averages the BGR channels over the ROI,
+    and maps the Green/Red ratio to biomass concentration via a polynomial
+    regression curve.
     """
 
     def __init__(self):
+        import cv2
+        import numpy as np
+
         cfg = get_config()
         self._vcfg = cfg["vision"]
         self._alerts = cfg["alerts"]
 
+        # Hot-path config values bound flat once: per-frame access is a
+        # slot load instead of a dataclass attribute dereference
+        vc = self._vcfg
+        self._roi_x, self._roi_y = vc.roi_x, vc.roi_y
+        self._roi_w, self._roi_h = vc.roi_w, vc.roi_h
+        self._bio_thresh = vc.biosecurity_confidence_threshold
+        self._bio_every = vc.biosecurity_check_interval
+        self._interval = 1.0 / vc.capture_fps if vc.capture_fps > 0 else 10.0
+
+        # ROI crop slices, computed lazily from the first frame's actual
+        # geometry (the camera may not honor the requested resolution)
+        self._roi_slice: Optional[tuple] = None
+        self._roi_frame_shape: Optional[tuple] = None
+
+        # Rotating pool of preallocated frame buffers for executor-bound
+        # work — frame.copy() per offload is ~2.6 MB of malloc churn
+        self._pool: list = []
+        self._pool_idx = 0
+
+        # Transparent OpenCL offload: wrapping the ROI in a UMat lets
+        # OpenCV run resize/mean on the iGPU where a runtime exists.
+        # Opt out with OPENCYCLO_UMAT=0.
+        self._use_umat = (
+            bool(cv2.ocl.haveOpenCL())
+            and os.environ.get("OPENCYCLO_UMAT", "1") != "0"
+        )
+        cv2.ocl.setUseOpenCL(self._use_umat)
+
+        # Horner evaluator specialized to the calibration coefficients
+        self._polyval = _make_polyval(self._vcfg.density_poly_coeffs)
+
         self._cap: Optional[cv2.VideoCapture] = None
         self._running = False
         self._latest_density: float = 0.0
         self._latest_green_ratio: float = 0.0
         self._frame_count: int = 0
-
-        # Biosecurity (industrial only)
+        # Content hash of the previous frame's thumbnail: an unchanged
+        # frame skips the whole ROI/ratio/polyval pipeline
+        self._last_hash: Optional[int] = None
+
+        # Biosecurity (industrial only). Frames accumulate in a small
+        # batch before inference: YOLO's Python-side pre/postprocess
+        # overhead dominates single-image calls, so batching ~doubles
+        # effective detection throughput
         self._yolo_model = None
+        self._bio_queue: list = []
+        # Alert dedupe: class name -> monotonic ts of last webhook, so a
+        # predator sitting in frame doesn't re-fire every check interval
+        self._alert_cache: OrderedDict[str, float] = OrderedDict()
+
+        # Reusable simulated-frame buffer — ~2.6 MB per allocation at
+        # 1280x720 if rebuilt every capture
+        self._sim_buf = np.empty(
+            (self._vcfg.resolution[1], self._vcfg.resolution[0], 3),
+            dtype=np.uint8,
+        )
 
-        # Snapshot directory for growth curve logging
+        # Snapshot directory for growth curve logging; snapshots are
+        # rate-limited by wall time so storage stays bounded regardless
+        # of capture FPS
         self._snapshot_dir = Path("data/snapshots")
+        self._last_snapshot_ts: float = 0.0
 
     async def initialize(self):
         """Initialize camera and optional YOLO model."""
@@ -74,8 +162,14 @@ class VisionDensitySensor:
         if self._vcfg.biosecurity_enabled and self._vcfg.biosecurity_model_path:
             await loop.run_in_executor(None, self._init_yolo)
 
+    def _init_simulated(self):
+        """Force simulation mode without probing hardware (test helper)."""
+        self._cap = None
+
     def _init_camera(self):
         """Open the webcam via OpenCV."""
+        import cv2
+
         try:
             self._cap = cv2.VideoCapture(self._vcfg.camera_index)
             if not self._cap.isOpened():
@@ -117,39 +211,41 @@ class VisionDensitySensor:
 
     def _extract_roi(self, frame: np.ndarray) -> np.ndarray:
         """Crop frame to the configured Region of Interest."""
-        x, y = self._vcfg.roi_x, self._vcfg.roi_y
-        w, h = self._vcfg.roi_w, self._vcfg.roi_h
-        # Clamp to frame bounds
         fh, fw = frame.shape[:2]
-        x = min(x, fw - 1)
-        y = min(y, fh - 1)
-        w = min(w, fw - x)
-        h = min(h, fh - y)
-        return frame[y:y+h, x:x+w]
+        if (fh, fw) != self._roi_frame_shape:
+            # Clamp to frame bounds once per frame geometry; subsequent
+            # frames reuse the cached slice pair
+            x = min(self._roi_x, fw - 1)
+            y = min(self._roi_y, fh - 1)
+            w = min(self._roi_w, fw - x)
+            h = min(self._roi_h, fh - y)
+            self._roi_slice = (slice(y, y + h), slice(x, x + w))
+            self._roi_frame_shape = (fh, fw)
+        return frame[self._roi_slice]
 
     def _compute_green_ratio(self, roi: np.ndarray) -> float:
         """
-        Compute the Green/Red channel ratio in HSV space.
+        Compute the Green/Red channel ratio of the ROI.
 
         As algae density increases, the culture transitions from clear →
-        pale green → vivid green → dark emerald → opaque. The Green
-        saturation channel and Green/Red ratio track this progression.
-        """
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        pale green → vivid green → dark emerald → opaque. The Green/Red
+        ratio tracks this progression. A single BGR mean pass suffices —
+        the HSV conversion the old code ran was computed then discarded.
 
-        # Extract mean Hue and Saturation
-        mean_hsv = cv2.mean(hsv)[:3]    # (H, S, V)
-
-        # Also compute in RGB space for the Green/Red ratio
-        mean_bgr = cv2.mean(roi)[:3]    # (B, G, R)
-        blue, green, red = mean_bgr
-
-        # Avoid division by zero
-        if red < 1.0:
-            red = 1.0
+        The ROI is block-averaged down 8x first: INTER_AREA is itself a
+        mean, so the final ratio is unchanged while the mean pass touches
+        64x fewer bytes.
+        """
+        import cv2
 
-        green_red_ratio = green / red
-        return green_red_ratio
+        downsample = roi.shape[0] >= 8 and roi.shape[1] >= 8
+        if self._use_umat:
+            roi = cv2.UMat(roi)
+        if downsample:
+            roi = cv2.resize(roi, (0, 0), fx=0.125, fy=0.125,
+                             interpolation=cv2.INTER_AREA)
+        _, green, red = cv2.mean(roi)[:3]   # (B, G, R)
+        return green / max(red, 1.0)
 
     def _ratio_to_density(self, ratio: float) -> float:
         """
@@ -163,9 +259,7 @@ class VisionDensitySensor:
 
         ⚠️ Default coefficients are PLACEHOLDER — calibration is required (OQ-3).
         """
-        coeffs = self._vcfg.density_poly_coeffs
-        density = sum(c * (ratio ** (len(coeffs) - 1 - i)) for i, c in enumerate(coeffs))
-        return max(0.0, density)
+        return max(0.0, self._polyval(ratio))
 
     async def _capture_frame(self) -> Optional[np.ndarray]:
         """Capture a single frame from the camera (or simulate)."""
@@ -180,36 +274,88 @@ class VisionDensitySensor:
             return None
         return frame
 
+    # 256-entry (B, G, R) color ramp for the simulated growth cycle,
+    # built lazily on first use (numpy is a deferred import)
+    _SIM_LUT = None
+
     def _simulate_frame(self) -> np.ndarray:
         """
         Generate a simulated frame for testing without a camera.
 
-        Simulates a culture that gets progressively greener over time.
+        Simulates a culture that gets progressively greener over time:
+        the pale → vivid-green interpolation is precomputed into a LUT
+        so each frame is a table lookup plus one broadcast assign.
         """
-        elapsed_minutes = (time.monotonic() % 600) / 600.0  # Cycle every 10 min
-        # Interpolate from pale (low density) to vivid green (high density)
-        green_intensity = int(80 + 175 * elapsed_minutes)
-        red_intensity = int(200 - 150 * elapsed_minutes)
-        blue_intensity = int(180 - 100 * elapsed_minutes)
+        if VisionDensitySensor._SIM_LUT is None:
+            import numpy as np
 
-        frame = np.full(
-            (self._vcfg.resolution[1], self._vcfg.resolution[0], 3),
-            (blue_intensity, green_intensity, red_intensity),
-            dtype=np.uint8,
-        )
-        return frame
+            frac = np.linspace(0.0, 1.0, 256)
+            VisionDensitySensor._SIM_LUT = np.stack(
+                [180 - 100 * frac, 80 + 175 * frac, 200 - 150 * frac],
+                axis=1,
+            ).astype(np.uint8)
+
+        # Cycle every 10 min; & 0xFF guards the frac == 1.0 edge
+        idx = int((time.monotonic() % 600) / 600.0 * 256) & 0xFF
+        self._sim_buf[:] = self._SIM_LUT[idx]
+        return self._sim_buf
+
+    # Minimum seconds between saved snapshots
+    SNAPSHOT_INTERVAL_S = 60.0
 
     def _save_snapshot(self, frame: np.ndarray, density: float, ratio: float):
-        """Save a timestamped snapshot for growth curve construction."""
+        """Encode and save a timestamped snapshot (blocking, runs in executor)."""
+        import cv2
+
         self._snapshot_dir.mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"snapshot_{ts}_d{density:.3f}_r{ratio:.3f}.jpg"
         filepath = self._snapshot_dir / filename
-        cv2.imwrite(str(filepath), frame)
+        # Quality 80 cuts file size ~30-50% vs the imwrite default with
+        # no visible loss for growth-curve purposes
+        ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        if not ok:
+            logger.warning("Snapshot JPEG encode failed")
+            return
+        filepath.write_bytes(buf.tobytes())
+
+    # Buffers in the offload pool. Must exceed BIO_BATCH_SIZE: the
+    # biosecurity queue can hold a full batch while a snapshot encode is
+    # in flight, and a pooled buffer must not be overwritten until its
+    # consumer is done with it.
+    POOL_SIZE = 6
+
+    def _copy_to_pool(self, frame: np.ndarray) -> np.ndarray:
+        """Copy a frame into the next preallocated pool buffer."""
+        import numpy as np
+
+        if not self._pool or self._pool[0].shape != frame.shape:
+            self._pool = [np.empty_like(frame) for _ in range(self.POOL_SIZE)]
+            self._pool_idx = 0
+        buf = self._pool[self._pool_idx]
+        self._pool_idx = (self._pool_idx + 1) % self.POOL_SIZE
+        np.copyto(buf, frame)
+        return buf
+
+    @staticmethod
+    def _frame_hash(frame: np.ndarray) -> int:
+        """Cheap content hash of a frame via a 32x32 thumbnail CRC."""
+        import cv2
+
+        thumb = cv2.resize(frame, (32, 32), interpolation=cv2.INTER_AREA)
+        return zlib.crc32(thumb.tobytes())
+
+    # Frames per YOLO inference call
+    BIO_BATCH_SIZE = 4
+    # Suppress repeat alerts for the same class within this window
+    ALERT_SUPPRESS_S = 300.0
+    # Cap the dedupe cache (LRU eviction)
+    ALERT_CACHE_MAX = 32
 
     async def _run_biosecurity(self, frame: np.ndarray):
         """
-        Run YOLOv8 inference to detect zooplankton predators or biofilm.
+        Queue a frame for batched YOLOv8 inference (zooplankton predators,
+        biofilm). Inference runs once BIO_BATCH_SIZE frames accumulate.
 
         Only runs in INDUSTRIAL profile when model is loaded.
         Triggers webhook if any detection confidence ≥ threshold.
@@ -217,8 +363,17 @@ class VisionDensitySensor:
         if self._yolo_model is None:
             return
 
+        # Pooled copy: the simulated path reuses its frame buffer across
+        # captures, and the batch must stay stable until inference runs
+        self._bio_queue.append(self._copy_to_pool(frame))
+        if len(self._bio_queue) < self.BIO_BATCH_SIZE:
+            return
+
+        batch, self._bio_queue = self._bio_queue, []
         loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(None, lambda: self._yolo_model(frame, verbose=False))
+        results = await loop.run_in_executor(
+            None, lambda: self._yolo_model(batch, verbose=False)
+        )
 
         for result in results:
             for box in result.boxes:
@@ -226,7 +381,18 @@ class VisionDensitySensor:
                 cls_id = int(box.cls[0])
                 cls_name = result.names.get(cls_id, f"class_{cls_id}")
 
-                if conf >= self._vcfg.biosecurity_confidence_threshold:
+                if conf >= self._bio_thresh:
+                    # Dedupe: the same class within the suppression
+                    # window is old news — skip the webhook and noise
+                    now = time.monotonic()
+                    last = self._alert_cache.get(cls_name, 0.0)
+                    if now - last < self.ALERT_SUPPRESS_S:
+                        continue
+                    self._alert_cache[cls_name] = now
+                    self._alert_cache.move_to_end(cls_name)
+                    while len(self._alert_cache) > self.ALERT_CACHE_MAX:
+                        self._alert_cache.popitem(last=False)
+
                     logger.warning(
                         f"🚨 BIOSECURITY ALERT: {cls_name} detected "
                         f"(confidence: {conf:.1%})"
@@ -247,7 +413,7 @@ class VisionDensitySensor:
         logs data, and optionally runs biosecurity inference.
         """
         self._running = True
-        interval = 1.0 / self._vcfg.capture_fps if self._vcfg.capture_fps > 0 else 10.0
+        interval = self._interval
         logger.info(f"Vision sensor started: {self._vcfg.capture_fps} FPS, interval={interval:.1f}s")
 
         try:
@@ -259,13 +425,23 @@ class VisionDensitySensor:
 
                 self._frame_count += 1
 
-                # Extract ROI and compute density
-                roi = self._extract_roi(frame)
-                ratio = self._compute_green_ratio(roi)
-                density = self._ratio_to_density(ratio)
+                # Static-frame short-circuit: hash a 32x32 thumbnail and
+                # reuse the previous result when the content is unchanged
+                # (constant simulated frames, slow-moving real cultures)
+                frame_hash = self._frame_hash(frame)
+                if frame_hash == self._last_hash:
+                    ratio = self._latest_green_ratio
+                    density = self._latest_density
+                else:
+                    self._last_hash = frame_hash
 
-                self._latest_green_ratio = ratio
-                self._latest_density = density
+                    # Extract ROI and compute density
+                    roi = self._extract_roi(frame)
+                    ratio = self._compute_green_ratio(roi)
+                    density = self._ratio_to_density(ratio)
+
+                    self._latest_green_ratio = ratio
+                    self._latest_density = density
 
                 log_sensor_data(
                     logger, "biomass_density", density, "g/L",
@@ -273,14 +449,22 @@ class VisionDensitySensor:
                     frame=self._frame_count,
                 )
 
-                # Save periodic snapshots (every 100 frames)
-                if self._frame_count % 100 == 0:
-                    self._save_snapshot(frame, density, ratio)
+                # Save periodic snapshots, at most one per minute. JPEG
+                # encode + disk write takes tens of ms — run it on the
+                # executor so it doesn't stall the capture loop, on a
+                # pooled copy so the loop can move on.
+                now = time.monotonic()
+                if now - self._last_snapshot_ts >= self.SNAPSHOT_INTERVAL_S:
+                    self._last_snapshot_ts = now
+                    asyncio.get_running_loop().run_in_executor(
+                        None, self._save_snapshot,
+                        self._copy_to_pool(frame), density, ratio,
+                    )
 
                 # Biosecurity check (every N frames)
                 if (
                     self._vcfg.biosecurity_enabled
-                    and self._frame_count % self._vcfg.biosecurity_check_interval == 0
+                    and self._frame_count % self._bio_every == 0
                 ):
                     await self._run_biosecurity(frame)
 